@@ -131,6 +131,11 @@ def post_process_html(
         logger.info("No nonce available on the request, returning html unmodified.")
         return html
 
+    # without tags or character references there is nothing to sanitize or extract,
+    # so skip the (expensive) HTML parsing and cleaning
+    if "<" not in html and "&" not in html:
+        return html
+
     lxml_etree_document = html5lib.parse(
         html,
         treebuilder="lxml",
@@ -105,6 +105,13 @@ class PostProcessingTests(SimpleTestCase):
 
         self.assertEqual(converted, "just plain text")
 
+    @patch("csp_post_processor.processor.html5lib.parse")
+    def test_plain_text_skips_parsing(self, mock_parse):
+        converted = post_process_html("just plain text", self.request)
+
+        self.assertEqual(converted, "just plain text")
+        mock_parse.assert_not_called()
+
     @patch("csp_post_processor.processor.get_html_id")
     def test_processing_cleans_and_extracts_styles(self, mock_get_html_id):
         mock_get_html_id.side_effect = get_counter_side_effect()
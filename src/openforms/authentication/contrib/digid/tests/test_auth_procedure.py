@@ -25,7 +25,11 @@ from openforms.submissions.tests.mixins import SubmissionsMixin
 from openforms.utils.tests.cache import clear_caches
 
 from ....constants import CO_SIGN_PARAMETER, FORM_AUTH_SESSION_KEY, AuthAttribute
-from ....contrib.tests.saml_utils import create_test_artifact, get_artifact_response
+from ....contrib.tests.saml_utils import (
+    SAML_PARSER,
+    create_test_artifact,
+    get_artifact_response,
+)
 from .utils import TEST_FILES
 
 
@@ -129,7 +133,7 @@ class AuthenticationStep2Tests(DigiDConfigMixin, TestCase):
         saml_request = b64decode(
             response.context["form"].initial["SAMLRequest"].encode("utf-8")
         )
-        tree = etree.fromstring(saml_request)
+        tree = etree.fromstring(saml_request, SAML_PARSER)
 
         self.assertEqual(
             tree.attrib,
@@ -174,7 +178,7 @@ class AuthenticationStep2Tests(DigiDConfigMixin, TestCase):
         saml_request = b64decode(
             response.context["form"].initial["SAMLRequest"].encode("utf-8")
         )
-        tree = etree.fromstring(saml_request)
+        tree = etree.fromstring(saml_request, SAML_PARSER)
 
         self.assertEqual(
             tree.attrib,
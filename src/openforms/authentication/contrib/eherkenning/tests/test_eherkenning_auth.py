@@ -6,7 +6,6 @@ from unittest.mock import patch
 from django.core.files import File
 from django.test import TestCase, override_settings
 from django.urls import reverse
-from django.utils.safestring import mark_safe
 
 import requests_mock
 from digid_eherkenning.models import EherkenningConfiguration
@@ -24,6 +23,7 @@ from openforms.utils.tests.cache import clear_caches
 
 from ....constants import CO_SIGN_PARAMETER, FORM_AUTH_SESSION_KEY, AuthAttribute
 from ....contrib.tests.saml_utils import (
+    SAML_PARSER,
     create_test_artifact,
     get_artifact_response,
     get_encrypted_attribute,
@@ -163,7 +163,7 @@ class AuthenticationStep2Tests(EHerkenningConfigMixin, TestCase):
         saml_request = b64decode(
             response.context["form"].initial["SAMLRequest"].encode("utf-8")
         )
-        tree = etree.fromstring(saml_request)
+        tree = etree.fromstring(saml_request, SAML_PARSER)
 
         self.assertEqual(
             tree.attrib,
@@ -211,7 +211,7 @@ class AuthenticationStep5Tests(EHerkenningConfigMixin, TestCase):
             "https://test-iwelcome.nl/broker/ars/1.13",
             content=_get_artifact_response(
                 "ArtifactResponse.xml",
-                {"encrypted_attribute": mark_safe(encrypted_attribute)},
+                {"encrypted_attribute": encrypted_attribute},
             ),
         )
         form = FormFactory.create(
@@ -435,7 +435,7 @@ class CoSignLoginAuthenticationTests(
             "https://test-iwelcome.nl/broker/ars/1.13",
             content=_get_artifact_response(
                 "ArtifactResponse.xml",
-                {"encrypted_attribute": mark_safe(encrypted_attribute)},
+                {"encrypted_attribute": encrypted_attribute},
             ),
         )
         # set the relay-state, see test ``test_authn_request_for_co_sign`` for the
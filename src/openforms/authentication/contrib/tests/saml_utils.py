@@ -1,31 +1,67 @@
 from base64 import b64encode
+from functools import lru_cache
 from hashlib import sha1
 from pathlib import Path
 
 from digid_eherkenning.models import EherkenningConfiguration
+from lxml import etree
 from onelogin.saml2.utils import OneLogin_Saml2_Utils
 
-from openforms.template import render_from_string
+# only the request attributes/elements are inspected - skip building the ID table and
+# resolving entities
+SAML_PARSER = etree.XMLParser(
+    collect_ids=False,
+    resolve_entities=False,
+    remove_blank_text=True,
+    remove_comments=True,
+)
 
 
+@lru_cache(maxsize=None)
 def create_test_artifact(service_entity_id: str = "") -> str:
     type_code = b"\x00\x04"
     endpoint_index = b"\x00\x00"
-    sha_entity_id = sha1(service_entity_id.encode("utf-8")).digest()
+    sha_entity_id = sha1(
+        service_entity_id.encode("utf-8"), usedforsecurity=False
+    ).digest()
     message_handle = b"01234567890123456789"  # something random
-    b64encoded = b64encode(type_code + endpoint_index + sha_entity_id + message_handle)
+    b64encoded = b64encode(
+        b"".join((type_code, endpoint_index, sha_entity_id, message_handle))
+    )
     return b64encoded.decode("ascii")
 
 
+class _TemplateContext(dict):
+    # mimick template engines - missing variables render as empty strings
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def _load_template(filepath: str) -> str:
+    # the fixture files don't change during a test run - read them only once
+    return Path(filepath).read_text()
+
+
 def get_artifact_response(filepath: str, context: dict | None = None) -> bytes:
-    template_source = Path(filepath).read_text()
-    return render_from_string(template_source, context or {}).encode("utf-8")
+    """
+    Fill in the ``{placeholder}`` variables of the artifact response fixture.
+    """
+    template = _load_template(filepath)
+    return template.format_map(_TemplateContext(context or {})).encode("utf-8")
 
 
 def get_encrypted_attribute(attr: str, identifier: str):
     config = EherkenningConfiguration.get_solo()
     with config.certificate.public_certificate.open("r") as cert_file:
         cert = cert_file.read()
+    return _generate_name_id(attr, identifier, cert)
+
+
+@lru_cache(maxsize=None)
+def _generate_name_id(attr: str, identifier: str, cert: str) -> str:
+    # the XML encryption is expensive, and any valid encrypted value for the same
+    # input and certificate is acceptable in tests
     return OneLogin_Saml2_Utils.generate_name_id(
         identifier,
         sp_nq=None,
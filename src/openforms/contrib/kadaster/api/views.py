@@ -1,4 +1,6 @@
 import logging
+import threading
+from concurrent.futures import Future
 from functools import partial
 
 from django.core.cache import cache
@@ -14,6 +16,7 @@ from rest_framework.views import APIView
 from openforms.api.serializers import ExceptionSerializer, ValidationErrorSerializer
 from openforms.api.views.mixins import ListMixin
 from openforms.contrib.kadaster.clients.bag import AddressResult
+from openforms.contrib.kadaster.clients.locatieserver import Location
 from openforms.submissions.api.permissions import AnyActiveSubmissionPermission
 
 from ..clients import get_bag_client, get_locatieserver_client
@@ -38,6 +41,46 @@ def lookup_address(postcode: str, number: str) -> AddressResult | None:
         return client.get_address(postcode, number)
 
 
+_inflight_searches: dict[str, Future[list[Location]]] = {}
+_inflight_searches_lock = threading.Lock()
+
+
+def search_address(query: str) -> list[Location]:
+    """
+    Search the addresses matching the query.
+
+    Concurrent searches for the same query in this process are coalesced into a
+    single call to the location server - callers arriving while a search is in
+    flight wait for and share its result.
+    """
+    with _inflight_searches_lock:
+        future = _inflight_searches.get(query)
+        in_flight = future is not None
+        if future is None:
+            future = _inflight_searches[query] = Future()
+
+    if in_flight:
+        return future.result()
+
+    try:
+        with get_locatieserver_client() as client:
+            locations = client.free_address_search(query)
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(locations)
+        return locations
+    finally:
+        with _inflight_searches_lock:
+            del _inflight_searches[query]
+
+
+def reverse_search_address(lat: float, lng: float) -> str:
+    with get_locatieserver_client() as client:
+        return client.reverse_address_search(lat, lng)
+
+
 class AddressAutocompleteView(APIView):
     """
     Get the street name and city when given a postcode and house number.
@@ -129,12 +172,17 @@ class LatLngSearchView(APIView):
         input_serializer = LatLngSearchInputSerializer(data=request.GET)
         input_serializer.is_valid(raise_exception=True)
 
-        client = get_locatieserver_client()
-        with client:
-            label = client.reverse_address_search(
-                input_serializer.validated_data["lat"],
-                input_serializer.validated_data["lng"],
-            )
+        lat = input_serializer.validated_data["lat"]
+        lng = input_serializer.validated_data["lng"]
+
+        # check the cache so we avoid hitting the remote API for the same location
+        # repeatedly. Empty results are not cached, as they can be caused by
+        # (temporary) errors.
+        cache_key = f"locatieserver|reverse_address_search|{lat}|{lng}"
+        if not (label := cache.get(cache_key)):
+            label = reverse_search_address(lat, lng)
+            if label:
+                cache.set(cache_key, label, timeout=ADDRESS_AUTOCOMPLETE_CACHE_TIMEOUT)
 
         if not label:
             return Response(status=status.HTTP_204_NO_CONTENT)
@@ -184,6 +232,14 @@ class AddressSearchView(ListMixin, APIView):
                 code="required",
             )
 
-        client = get_locatieserver_client()
-        with client:
-            return client.free_address_search(query)
+        # check the cache so we avoid hitting the remote API too often - the same
+        # (partial) queries come in repeatedly while users are typing. Empty results
+        # are not cached, as they can be caused by (temporary) errors.
+        cache_key = f"locatieserver|free_address_search|{query}"
+        if not (locations := cache.get(cache_key)):
+            locations = search_address(query)
+            if locations:
+                cache.set(
+                    cache_key, locations, timeout=ADDRESS_AUTOCOMPLETE_CACHE_TIMEOUT
+                )
+        return locations
@@ -1,6 +1,7 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from unittest.mock import patch
 
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 
 import requests
 import requests_mock
@@ -11,7 +12,9 @@ from zgw_consumers.test.factories import ServiceFactory
 
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
 
+from ..api.views import _inflight_searches, search_address
 from ..models import KadasterApiConfig
 
 
@@ -38,6 +41,9 @@ class AddressSearchApiTests(SubmissionsMixin, APITestCase):
         self.config_mock = config_patcher.start()
         self.addCleanup(config_patcher.stop)
 
+        clear_caches()
+        self.addCleanup(clear_caches)
+
     @requests_mock.Mocker()
     def test_call_with_query_parameter_utrecht(self, m):
         m.get(
@@ -315,3 +321,60 @@ class AddressSearchApiTests(SubmissionsMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         body = response.json()
         self.assertEqual(body, [])
+
+    @requests_mock.Mocker()
+    def test_endpoint_uses_caching(self, m):
+        m.get(
+            "https://kadaster/v3_1/free",
+            status_code=200,
+            json={
+                "response": {
+                    "docs": [
+                        {
+                            "weergavenaam": "Gemeente Utrecht",
+                            "centroide_ll": "POINT(5.0747543 52.09113798)",
+                            "centroide_rd": "POINT(133587.182 455921.594)",
+                        },
+                    ],
+                }
+            },
+        )
+        url = reverse("api:geo:address-search")
+        self._add_submission_to_session(self.submission)
+
+        # make the request twice, second one should use cache
+        response1 = self.client.get(url, {"q": "utrecht"})
+        response2 = self.client.get(url, {"q": "utrecht"})
+
+        self.assertEqual(response1.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+        self.assertEqual(response1.json(), response2.json())
+        self.assertEqual(len(m.request_history), 1)
+
+
+class SearchAddressTests(SimpleTestCase):
+    @patch("openforms.contrib.kadaster.api.views.get_locatieserver_client")
+    def test_concurrent_searches_are_coalesced(self, m_get_client):
+        in_flight = Future()
+
+        with (
+            patch.dict(_inflight_searches, {"utrecht": in_flight}),
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            result = executor.submit(search_address, "utrecht")
+            in_flight.set_result(["Gemeente Utrecht"])
+
+            self.assertEqual(result.result(), ["Gemeente Utrecht"])
+
+        m_get_client.assert_not_called()
+
+    @patch("openforms.contrib.kadaster.api.views.get_locatieserver_client")
+    def test_in_flight_search_is_cleaned_up(self, m_get_client):
+        client = m_get_client.return_value.__enter__.return_value
+        client.free_address_search.return_value = []
+
+        result = search_address("utrecht")
+
+        self.assertEqual(result, [])
+        client.free_address_search.assert_called_once_with("utrecht")
+        self.assertNotIn("utrecht", _inflight_searches)
@@ -11,6 +11,7 @@ from rest_framework.test import APITestCase
 from openforms.appointments.contrib.qmatic.tests.factories import ServiceFactory
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
 
 from ..models import KadasterApiConfig
 
@@ -38,6 +39,9 @@ class AddressSearchApiTests(SubmissionsMixin, APITestCase):
         self.config_mock = config_patcher.start()
         self.addCleanup(config_patcher.stop)
 
+        clear_caches()
+        self.addCleanup(clear_caches)
+
     @requests_mock.Mocker()
     def test_call_with_query_parameter_utrecht(self, m):
         m.get(
@@ -223,3 +227,26 @@ class AddressSearchApiTests(SubmissionsMixin, APITestCase):
         response = self.client.get(url, {"lat": "52.09113798", "lng": "5.0747543"})
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    @requests_mock.Mocker()
+    def test_endpoint_uses_caching(self, m):
+        m.get(
+            "https://kadaster/v3_1/reverse",
+            status_code=200,
+            json={
+                "response": {
+                    "docs": [{"weergavenaam": "Gemeente Utrecht"}],
+                }
+            },
+        )
+        url = reverse("api:geo:latlng-search")
+        self._add_submission_to_session(self.submission)
+
+        # make the request twice, second one should use cache
+        response1 = self.client.get(url, {"lat": "52.09113798", "lng": "5.0747543"})
+        response2 = self.client.get(url, {"lat": "52.09113798", "lng": "5.0747543"})
+
+        self.assertEqual(response1.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+        self.assertEqual(response1.json(), response2.json())
+        self.assertEqual(len(m.request_history), 1)
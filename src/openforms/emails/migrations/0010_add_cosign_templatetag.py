@@ -8,20 +8,29 @@ from openforms.utils.migrations_utils.regex import add_cosign_info_templatetag
 def add_cosign_template_tag_to_email_confirmation_template(apps, _):
     ConfirmationEmailTemplate = apps.get_model("emails", "ConfirmationEmailTemplate")
 
-    templates = ConfirmationEmailTemplate.objects.all()
-    if not templates.exists():
+    templates_to_update = []
+    for template in ConfirmationEmailTemplate.objects.all():
+        changed = False
+        for field in ("content", "content_en", "content_nl"):
+            content = getattr(template, field)
+            # the translated content fields may be empty
+            if field != "content" and not content:
+                continue
+            updated_content = add_cosign_info_templatetag(content)
+            if updated_content == content:
+                continue
+            setattr(template, field, updated_content)
+            changed = True
+
+        if changed:
+            templates_to_update.append(template)
+
+    # skip the writes if all templates are already up to date
+    if not templates_to_update:
         return
 
-    for template in templates:
-        template.content = add_cosign_info_templatetag(template.content)
-        if template.content_en:
-            template.content_en = add_cosign_info_templatetag(template.content_en)
-
-        if template.content_nl:
-            template.content_nl = add_cosign_info_templatetag(template.content_nl)
-
     ConfirmationEmailTemplate.objects.bulk_update(
-        templates, fields=["content", "content_en", "content_nl"]
+        templates_to_update, fields=["content", "content_en", "content_nl"]
     )
 
 
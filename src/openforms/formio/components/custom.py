@@ -2,7 +2,7 @@ import logging
 from datetime import date
 from typing import Protocol
 
-from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.utils.html import format_html
 from django.utils.translation import gettext as _
 
@@ -15,7 +15,7 @@ from openforms.submissions.models import Submission
 from openforms.typing import DataMapping
 from openforms.utils.date import format_date_value
 from openforms.utils.validators import BSNValidator
-from openforms.validations.service import PluginValidator
+from openforms.validations.service import get_plugin_validator
 
 from ..dynamic_config.date import mutate as mutate_min_max_validation
 from ..formatters.custom import (
@@ -32,7 +32,7 @@ from .np_family_members.constants import FamilyMembersDataAPIChoices
 from .np_family_members.haal_centraal import get_np_family_members_haal_centraal
 from .np_family_members.models import FamilyMembersTypeConfig
 from .np_family_members.stuf_bg import get_np_family_members_stuf_bg
-from .utils import _normalize_pattern
+from .utils import EMPTY_CONFIG, get_pattern_validator
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ class Date(BasePlugin[DateComponent]):
         """
         # relevant validators: required, datePicker.minDate and datePicker.maxDate
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         date_picker = component.get("datePicker") or {}
         validators = []
@@ -125,7 +125,7 @@ class Map(BasePlugin[Component]):
             component["initialCenter"]["lng"] = config.form_map_default_longitude
 
     def build_serializer_field(self, component: Component) -> serializers.ListField:
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         base = serializers.FloatField(
             required=required,
@@ -159,7 +159,7 @@ class Postcode(BasePlugin[Component]):
         self, component: Component
     ) -> serializers.CharField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         # dynamically add in more kwargs based on the component configuration
         extra = {}
@@ -167,15 +167,11 @@ class Postcode(BasePlugin[Component]):
         # adding in the validator is more explicit than changing to serialiers.RegexField,
         # which essentially does the same.
         if pattern := validate.get("pattern"):
-            validators.append(
-                RegexValidator(
-                    _normalize_pattern(pattern),
-                    message=_("This value does not match the required pattern."),
-                )
-            )
+            validators.append(get_pattern_validator(pattern))
 
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators.extend(
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        )
 
         if validators:
             extra["validators"] = validators
@@ -282,15 +278,16 @@ class BSN(BasePlugin[Component]):
         self, component: Component
     ) -> serializers.CharField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         # dynamically add in more kwargs based on the component configuration
         extra = {}
 
         validators = [BSNValidator()]
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators.extend(
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        )
 
         extra["validators"] = validators
 
@@ -1,4 +1,5 @@
 from ..typing import OptionDict
+from .utils import EMPTY_CONFIG
 
 
 def translate_options(
@@ -7,12 +8,16 @@ def translate_options(
     enabled: bool,
 ) -> None:
     for option in options:
-        if not (translations := option.get("openForms", {}).get("translations")):
+        if not (
+            translations := option.get("openForms", EMPTY_CONFIG).get("translations")
+        ):
             continue
 
-        translated_label = translations.get(language_code, {}).get("label", "")
-        if enabled and translated_label:
-            option["label"] = translated_label
+        # skip the lookups entirely if translations are disabled
+        if enabled:
+            translation = translations.get(language_code, EMPTY_CONFIG)
+            if translated_label := translation.get("label"):
+                option["label"] = translated_label
 
         # always clean up
         del option["openForms"]["translations"]  # type: ignore
@@ -1,3 +1,17 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from django.core.validators import RegexValidator
+from django.utils.translation import gettext_lazy as _
+
+EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+"""
+Shared, read-only default for optional (nested) component configuration, such as
+``validate``, avoiding a new empty dict for every lookup.
+"""
+
+
 def _normalize_pattern(pattern: str) -> str:
     """
     Normalize a regex pattern so that it matches from beginning to the end of the value.
@@ -7,3 +21,17 @@ def _normalize_pattern(pattern: str) -> str:
     if not pattern.endswith("$"):
         pattern = f"{pattern}$"
     return pattern
+
+
+@lru_cache(maxsize=1024)
+def get_pattern_validator(pattern: str) -> RegexValidator:
+    """
+    Get the (shared) validator checking that a value matches the ``validate.pattern``.
+
+    Validators are stateless, so components with the same pattern can use the same
+    instance and the regex only needs to be compiled once.
+    """
+    return RegexValidator(
+        _normalize_pattern(pattern),
+        message=_("This value does not match the required pattern."),
+    )
@@ -7,9 +7,11 @@ adjacent custom.py module.
 
 import logging
 from datetime import time
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
-from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.urls import get_script_prefix
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
@@ -19,9 +21,9 @@ from rest_framework.reverse import reverse
 from csp_post_processor import post_process_html
 from openforms.config.constants import UploadFileType
 from openforms.config.models import GlobalConfiguration
-from openforms.typing import DataMapping
+from openforms.typing import DataMapping, StrOrPromise
 from openforms.utils.urls import build_absolute_uri
-from openforms.validations.service import PluginValidator
+from openforms.validations.service import get_plugin_validator
 
 from ..dynamic_config.dynamic_options import add_options_to_config
 from ..formatters.formio import (
@@ -54,7 +56,7 @@ from ..typing import (
     TextFieldComponent,
 )
 from .translations import translate_options
-from .utils import _normalize_pattern
+from .utils import EMPTY_CONFIG, get_pattern_validator
 
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
@@ -80,7 +82,7 @@ class TextField(BasePlugin[TextFieldComponent]):
         self, component: TextFieldComponent
     ) -> serializers.CharField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         # dynamically add in more kwargs based on the component configuration
@@ -92,16 +94,12 @@ class TextField(BasePlugin[TextFieldComponent]):
         # which essentially does the same.
         validators = []
         if pattern := validate.get("pattern"):
-            validators.append(
-                RegexValidator(
-                    _normalize_pattern(pattern),
-                    message=_("This value does not match the required pattern."),
-                )
-            )
+            validators.append(get_pattern_validator(pattern))
 
         # Run plugin validators at the end after all basic checks have been performed.
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators.extend(
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        )
 
         if validators:
             extra["validators"] = validators
@@ -125,7 +123,7 @@ class Email(BasePlugin):
         self, component: Component
     ) -> serializers.EmailField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         # dynamically add in more kwargs based on the component configuration
@@ -133,9 +131,9 @@ class Email(BasePlugin):
         if (max_length := validate.get("maxLength")) is not None:
             extra["max_length"] = max_length
 
-        validators = []
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators = [
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        ]
 
         if validators:
             extra["validators"] = validators
@@ -167,27 +165,60 @@ class TimeBetweenValidator:
     def __init__(self, min_time: time, max_time: time) -> None:
         self.min_time = min_time
         self.max_time = max_time
+        # the kind of range is known up front, so pick the check to run only once
+        self._check = (
+            self._check_same_day if min_time < max_time else self._check_overnight
+        )
 
     def __call__(self, value: time):
+        self._check(value)
+
+    def _check_same_day(self, value: time) -> None:
         # same day - straight forward comparison
-        if self.min_time < self.max_time:
-            if value < self.min_time:
-                raise serializers.ValidationError(
-                    _("Value is before minimum time"),
-                    code="min_value",
-                )
-            if value > self.max_time:
-                raise serializers.ValidationError(
-                    _("Value is after maximum time"),
-                    code="max_value",
-                )
+        if value < self.min_time:
+            raise serializers.ValidationError(
+                _("Value is before minimum time"),
+                code="min_value",
+            )
+        if value > self.max_time:
+            raise serializers.ValidationError(
+                _("Value is after maximum time"),
+                code="max_value",
+            )
 
+    def _check_overnight(self, value: time) -> None:
         # min time is on the day before the max time applies (e.g. 20:00 -> 04:00)
-        else:
-            if value < self.min_time and value > self.max_time:
-                raise serializers.ValidationError(
-                    _("Value is not between mininum and maximum time."), code="invalid"
-                )
+        if value < self.min_time and value > self.max_time:
+            raise serializers.ValidationError(
+                _("Value is not between mininum and maximum time."), code="invalid"
+            )
+
+
+@lru_cache(maxsize=1024)
+def _get_time_validators(
+    min_time: str | None, max_time: str | None
+) -> tuple[Callable[[time], None], ...]:
+    """
+    Build the validators for the min/max time configuration.
+
+    The validators are stateless, so they can be shared by all time components with
+    the same min/max time.
+    """
+    match (min_time, max_time):
+        case (None, None):
+            return ()
+        case (str(), None):
+            return (MinValueValidator(time.fromisoformat(min_time)),)
+        case (None, str()):
+            return (MaxValueValidator(time.fromisoformat(max_time)),)
+        case _:
+            assert min_time is not None and max_time is not None
+            return (
+                TimeBetweenValidator(
+                    time.fromisoformat(min_time),
+                    time.fromisoformat(max_time),
+                ),
+            )
 
 
 @register("time")
@@ -198,30 +229,16 @@ class Time(BasePlugin[Component]):
         self, component: Component
     ) -> FormioTimeField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
-        validators = []
-
-        match (
-            min_time := validate.get("minTime"),
-            max_time := validate.get("maxTime"),
-        ):
-            case (None, None):
-                pass
-            case (str(), None):
-                validators.append(MinValueValidator(time.fromisoformat(min_time)))
-            case (None, str()):
-                validators.append(MaxValueValidator(time.fromisoformat(max_time)))
-            case (str(), str()):
-                validators.append(
-                    TimeBetweenValidator(
-                        time.fromisoformat(min_time),
-                        time.fromisoformat(max_time),
-                    )
-                )
-            case _:
-                logger.warning("Got unexpected min/max time in component %r", component)
+        min_time = validate.get("minTime")
+        max_time = validate.get("maxTime")
+        if isinstance(min_time, str | None) and isinstance(max_time, str | None):
+            validators = list(_get_time_validators(min_time, max_time))
+        else:
+            logger.warning("Got unexpected min/max time in component %r", component)
+            validators = []
 
         base = FormioTimeField(
             required=required,
@@ -239,7 +256,7 @@ class PhoneNumber(BasePlugin):
         self, component: Component
     ) -> serializers.CharField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         # dynamically add in more kwargs based on the component configuration
@@ -253,16 +270,12 @@ class PhoneNumber(BasePlugin):
         # which essentially does the same.
         validators = []
         if pattern := validate.get("pattern"):
-            validators.append(
-                RegexValidator(
-                    _normalize_pattern(pattern),
-                    message=_("This value does not match the required pattern."),
-                )
-            )
+            validators.append(get_pattern_validator(pattern))
 
         # Run plugin validators at the end after all basic checks have been performed.
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators.extend(
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        )
 
         if validators:
             extra["validators"] = validators
@@ -278,6 +291,20 @@ class PhoneNumber(BasePlugin):
         return serializers.ListField(child=base) if multiple else base
 
 
+@lru_cache(maxsize=8)
+def _get_upload_endpoint(script_prefix: str) -> str:
+    # the URL patterns don't change at runtime, but the reversed URL includes the
+    # script prefix, so it must be part of the cache key
+    return reverse("api:formio:temporary-file-upload")
+
+
+@lru_cache(maxsize=32)
+def _get_file_type_labels(mimetypes: tuple[str, ...]) -> tuple[StrOrPromise, ...]:
+    # the labels are lazy translations, so they can be cached regardless of the
+    # active language
+    return tuple(UploadFileType(mimetype).label for mimetype in mimetypes)
+
+
 @register("file")
 class File(BasePlugin[FileComponent]):
     formatter = FileFormatter
@@ -285,7 +312,7 @@ class File(BasePlugin[FileComponent]):
     @staticmethod
     def rewrite_for_request(component: FileComponent, request: Request):
         # write the upload endpoint information
-        upload_endpoint = reverse("api:formio:temporary-file-upload")
+        upload_endpoint = _get_upload_endpoint(get_script_prefix())
         component["url"] = build_absolute_uri(upload_endpoint, request=request)
 
         # check if we need to apply "filePattern" modifications
@@ -296,9 +323,7 @@ class File(BasePlugin[FileComponent]):
             component["filePattern"] = ",".join(mimetypes)
             component["file"].update(
                 {
-                    "allowedTypesLabels": [
-                        UploadFileType(mimetype).label for mimetype in mimetypes
-                    ],
+                    "allowedTypesLabels": list(_get_file_type_labels(tuple(mimetypes))),
                 }
             )
 
@@ -311,7 +336,7 @@ class TextArea(BasePlugin[Component]):
         self, component: Component
     ) -> serializers.CharField | serializers.ListField:
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         # dynamically add in more kwargs based on the component configuration
@@ -339,7 +364,7 @@ class Number(BasePlugin):
     ) -> serializers.FloatField | serializers.ListField:
         # new builder no longer exposes this, but existing forms may have multiple set
         multiple = component.get("multiple", False)
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         extra = {}
@@ -348,9 +373,9 @@ class Number(BasePlugin):
         if (min_value := validate.get("min")) is not None:
             extra["min_value"] = min_value
 
-        validators = []
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators = [
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        ]
 
         if validators:
             extra["validators"] = validators
@@ -381,7 +406,7 @@ class Checkbox(BasePlugin[Component]):
     formatter = CheckboxFormatter
 
     def build_serializer_field(self, component: Component) -> serializers.BooleanField:
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         # dynamically add in more kwargs based on the component configuration
@@ -390,8 +415,9 @@ class Checkbox(BasePlugin[Component]):
         validators = []
         if required:
             validators.append(validate_required_checkbox)
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators.extend(
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        )
 
         if validators:
             extra["validators"] = validators
@@ -434,14 +460,14 @@ class Select(BasePlugin[SelectComponent]):
         )
 
     def localize(self, component: SelectComponent, language_code: str, enabled: bool):
-        if not (options := component.get("data", {}).get("values", [])):
+        if not (options := component.get("data", EMPTY_CONFIG).get("values", [])):
             return
         translate_options(options, language_code, enabled)
 
     def build_serializer_field(
         self, component: SelectComponent
     ) -> serializers.ChoiceField:
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         assert "values" in component["data"]
         choices = [
@@ -473,7 +499,7 @@ class Currency(BasePlugin[Component]):
     formatter = CurrencyFormatter
 
     def build_serializer_field(self, component: Component) -> serializers.FloatField:
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
 
         extra = {}
@@ -482,9 +508,9 @@ class Currency(BasePlugin[Component]):
         if (min_value := validate.get("min")) is not None:
             extra["min_value"] = min_value
 
-        validators = []
-        if plugin_ids := validate.get("plugins", []):
-            validators += [PluginValidator(plugin) for plugin in plugin_ids]
+        validators = [
+            get_plugin_validator(plugin) for plugin in validate.get("plugins") or ()
+        ]
 
         if validators:
             extra["validators"] = validators
@@ -518,7 +544,7 @@ class Radio(BasePlugin[RadioComponent]):
         value may not be required. The available choices are taken from the ``values``
         key, which may be set dynamically (see :meth:`mutate_config_dynamically`).
         """
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         choices = [(value["value"], value["label"]) for value in component["values"]]
         return serializers.ChoiceField(
@@ -534,7 +560,7 @@ class Signature(BasePlugin[Component]):
     formatter = SignatureFormatter
 
     def build_serializer_field(self, component: Component) -> serializers.CharField:
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         return serializers.CharField(required=required, allow_blank=not required)
 
@@ -568,7 +594,7 @@ class EditGrid(BasePlugin[EditGridComponent]):
     def build_serializer_field(
         self, component: EditGridComponent
     ) -> serializers.ListField:
-        validate = component.get("validate", {})
+        validate = component.get("validate", EMPTY_CONFIG)
         required = validate.get("required", False)
         nested = build_serializer(
             components=component.get("components", []),
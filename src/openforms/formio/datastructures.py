@@ -28,6 +28,7 @@ class FormioConfigurationWrapper:
     _cached_component_map: dict[str, Component] | None = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
+    _nodes_by_key: None | dict[str, list[Component]] = None
 
     def __init__(self, configuration: JSONObject):
         self._configuration = configuration
@@ -42,8 +43,7 @@ class FormioConfigurationWrapper:
         return self._cached_component_map
 
     def __iter__(self) -> Iterator[Component]:
-        for component in self.component_map.values():
-            yield component
+        return iter(self.component_map.values())
 
     def __contains__(self, key: str) -> bool:
         return key in self.component_map
@@ -77,15 +77,29 @@ class FormioConfigurationWrapper:
             }
         return self._reverse_flattened
 
+    def _get_nodes(self, key: str) -> list[Component]:
+        """
+        Get the nodes from the root down to (and including) the component with ``key``.
+        """
+        if self._nodes_by_key is None:
+            self._nodes_by_key = {}
+        if (nodes := self._nodes_by_key.get(key)) is None:
+            config_path = self.reverse_flattened[key]
+            path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
+            nodes = []  # leftmost is root, rightmost is leaf
+            for depth in range(len(path_bits)):
+                path = ".".join(path_bits[: depth + 1])
+                component = cast(Component, glom(self.configuration, path))
+                nodes.append(component)
+            self._nodes_by_key[key] = nodes
+        return nodes
+
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
-        return all(is_visible_in_frontend(node, values) for node in nodes)
+        # the tree structure is static, only the (conditional) visibility depends on
+        # the values - a hidden parent short-circuits the check for its descendants
+        return all(
+            is_visible_in_frontend(node, values) for node in self._get_nodes(key)
+        )
 
 
 class FormioData(UserDict):
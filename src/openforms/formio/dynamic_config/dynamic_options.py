@@ -3,13 +3,13 @@ import json
 from django.template.defaultfilters import escape_filter as escape
 from django.utils.translation import gettext as _
 
-from glom import assign, glom
-from json_logic import jsonLogic
+from json_logic import get_var, jsonLogic
 
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 from openforms.typing import DataMapping, JSONValue
 
+from ..components.utils import EMPTY_CONFIG
 from ..typing import Component
 
 
@@ -27,30 +27,53 @@ def is_or_contains_none(option: JSONValue) -> bool:
 
 
 def escape_option(option: JSONValue) -> list[str]:
-    return [escape(item) for item in option]
+    value, label = option
+    escaped_value = escape(value)
+    # normalised primitive options use the same object for value and label
+    escaped_label = escaped_value if label is value else escape(label)
+    return [escaped_value, escaped_label]
 
 
 def deduplicate_options(
     options: JSONValue,
 ) -> JSONValue:
+    # escaped options are lists of strings - track them as tuples so that the
+    # membership check does not scan all previously seen options
+    seen = set()
     new_options = []
     for option in options:
-        if option not in new_options:
-            new_options.append(option)
+        if (key := tuple(option)) in seen:
+            continue
+        seen.add(key)
+        new_options.append(option)
     return new_options
 
 
+def evaluate_items_expression(items_expression: JSONValue, data: DataMapping):
+    # The vast majority of items expressions are plain variable references - look
+    # them up directly instead of going through the generic interpreter dispatch.
+    if (
+        isinstance(items_expression, dict)
+        and len(items_expression) == 1
+        and isinstance(var_name := items_expression.get("var"), str)
+    ):
+        return get_var(data or {}, var_name)
+    return jsonLogic(items_expression, data)
+
+
 def add_options_to_config(
     component: Component,
     data: DataMapping,
     submission: Submission,
     options_path: str = "values",
 ) -> None:
-    if glom(component, "openForms.dataSrc", default=None) != "variable":
+    # cheap early exit - manually specified options are by far the most common
+    of_config = component.get("openForms") or EMPTY_CONFIG
+    if of_config.get("dataSrc") != "variable":
         return
 
-    items_expression = glom(component, "openForms.itemsExpression")
-    items_array = jsonLogic(items_expression, data)
+    items_expression = of_config["itemsExpression"]
+    items_array = evaluate_items_expression(items_expression, data)
     if not items_array:
         return
 
@@ -97,12 +120,12 @@ def add_options_to_config(
 
     escaped_options = [escape_option(option) for option in normalised_options]
     deduplicated_options = deduplicate_options(escaped_options)
-    assign(
-        component,
-        options_path,
-        [
-            {"label": escaped_label, "value": escaped_key}
-            for escaped_key, escaped_label in deduplicated_options
-        ],
-        missing=dict,
-    )
+    # resolve the (nested) container of the options directly rather than through glom
+    *parent_bits, options_key = options_path.split(".")
+    container = component
+    for bit in parent_bits:
+        container = container.setdefault(bit, {})
+    container[options_key] = [
+        {"label": escaped_label, "value": escaped_key}
+        for escaped_key, escaped_label in deduplicated_options
+    ]
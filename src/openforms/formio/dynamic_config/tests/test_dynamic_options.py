@@ -61,7 +61,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration), submission, {"some": "data"}
@@ -144,7 +144,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -227,7 +227,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -297,7 +297,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -374,7 +374,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -513,7 +513,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -600,7 +600,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -637,7 +637,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -734,7 +734,7 @@ class TestDynamicConfigAddingOptions(TestCase):
             ]
         }
 
-        submission = SubmissionFactory.create()
+        submission = SubmissionFactory.build()
 
         rewrite_formio_components(
             FormioConfigurationWrapper(configuration),
@@ -1,7 +1,5 @@
 from django.test import SimpleTestCase, tag
 
-from hypothesis import given, strategies as st
-
 from openforms.typing import JSONValue
 
 from ...typing import Component
@@ -70,21 +68,23 @@ class PhoneNumberValidationTests(SimpleTestCase):
         error = extract_error(errors, component["key"])
         self.assertEqual(error.code, "max_length")
 
-    @given(validator=st.sampled_from(["phonenumber-international", "phonenumber-nl"]))
-    def test_phonenumber_with_plugin_validator(self, validator: str):
-        component: Component = {
-            "type": "phoneNumber",
-            "key": "foo",
-            "label": "Phone",
-            "validate": {"plugins": [validator]},
-        }
+    def test_phonenumber_with_plugin_validator(self):
         data: JSONValue = {"foo": "notaphonenumber"}
 
-        is_valid, errors = validate_formio_data(component, data)
+        for validator in ("phonenumber-international", "phonenumber-nl"):
+            with self.subTest(validator=validator):
+                component: Component = {
+                    "type": "phoneNumber",
+                    "key": "foo",
+                    "label": "Phone",
+                    "validate": {"plugins": [validator]},
+                }
 
-        self.assertFalse(is_valid)
-        error = extract_error(errors, "foo")
-        self.assertEqual(error.code, "invalid")
+                is_valid, errors = validate_formio_data(component, data)
+
+                self.assertFalse(is_valid)
+                error = extract_error(errors, "foo")
+                self.assertEqual(error.code, "invalid")
 
     @tag("gh-4068")
     def test_multiple_with_form_builder_empty_defaults(self):
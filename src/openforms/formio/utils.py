@@ -23,6 +23,17 @@ def _is_column_component(component: ComponentLike) -> TypeGuard[ColumnsComponent
     return component.get("type") == "columns"
 
 
+def _iter_child_components(
+    configuration: ComponentLike, recursive: bool
+) -> Iterator[Component]:
+    components = configuration.get("components", [])
+    if _is_column_component(configuration) and recursive:
+        assert not components, "Both nested components and columns found"
+        for column in configuration["columns"]:
+            yield from column.get("components", [])
+    yield from components
+
+
 @elasticapm.capture_span(span_type="app.formio.configuration")
 def iter_components(
     configuration: ComponentLike,
@@ -31,35 +42,30 @@ def iter_components(
     _mark_root=False,
     recurse_into_editgrid: bool = True,
 ) -> Iterator[Component]:
-    components = configuration.get("components", [])
-    if _is_column_component(configuration) and recursive:
-        assert not components, "Both nested components and columns found"
-        for column in configuration["columns"]:
-            yield from iter_components(
-                configuration=column,
-                recursive=recursive,
-                _is_root=False,
-                recurse_into_editgrid=recurse_into_editgrid,
-            )
-
-    for component in components:
-        if _mark_root:
+    if _mark_root:
+        for component in configuration.get("components", []):
             component["_is_root"] = _is_root
+
+    # Depth-first traversal with an explicit stack rather than recursive generators,
+    # which would pass every component through a generator frame (and APM span) for
+    # each level of nesting.
+    stack = [_iter_child_components(configuration, recursive)]
+    while stack:
+        if (component := next(stack[-1], None)) is None:
+            stack.pop()
+            continue
+
         yield component
-        if recursive:
-            # TODO: find a cleaner solution - currently just not yielding these is not
-            # an option because we have some special treatment for editgrid data which
-            # 'copies' the nested components for further processing.
-            # Ideally, with should be able to delegate this behaviour to the registered
-            # component classes, but that's a refactor too big for the current task(s).
-            if component.get("type") == "editgrid" and not recurse_into_editgrid:
-                continue
-            yield from iter_components(
-                configuration=component,
-                recursive=recursive,
-                _is_root=False,
-                recurse_into_editgrid=recurse_into_editgrid,
-            )
+        if not recursive:
+            continue
+        # TODO: find a cleaner solution - currently just not yielding these is not
+        # an option because we have some special treatment for editgrid data which
+        # 'copies' the nested components for further processing.
+        # Ideally, with should be able to delegate this behaviour to the registered
+        # component classes, but that's a refactor too big for the current task(s).
+        if component.get("type") == "editgrid" and not recurse_into_editgrid:
+            continue
+        stack.append(_iter_child_components(component, recursive))
 
 
 def iterate_components_with_configuration_path(
@@ -169,22 +175,6 @@ def is_layout_component(component):
     return False
 
 
-def component_in_editgrid(configuration: dict, component: dict) -> bool:
-    # Get all the editgrid components in the configuration
-    editgrids = []
-    for comp in iter_components(configuration=configuration):
-        if comp["type"] == "editgrid":
-            editgrids.append(comp)
-
-    # Check if the component is in the editgrid
-    for editgrid in editgrids:
-        for comp in iter_components(configuration=editgrid):
-            if comp["key"] == component["key"]:
-                return True
-
-    return False
-
-
 def get_component_datatype(component):
     component_type = component["type"]
     if component.get("multiple"):
@@ -7,7 +7,6 @@ from django.utils.translation import gettext_lazy as _
 from glom import Path, glom
 
 from openforms.formio.utils import (
-    component_in_editgrid,
     get_component_datatype,
     get_component_default_value,
     is_layout_component,
@@ -37,26 +36,31 @@ class FormVariableManager(models.Manager):
 
     def create_for_formstep(self, form_step: "FormStep") -> list["FormVariable"]:
         form_definition_configuration = form_step.form_definition.configuration
-        component_keys = [
-            component["key"]
-            for component in iter_components(
-                configuration=form_definition_configuration, recursive=True
-            )
-        ]
-        existing_form_variables_keys = form_step.form.formvariable_set.filter(
-            key__in=component_keys,
-            form_definition=form_step.form_definition,
-        ).values_list("key", flat=True)
+        components = list(
+            iter_components(configuration=form_definition_configuration, recursive=True)
+        )
+        component_keys = [component["key"] for component in components]
+        existing_form_variables_keys = set(
+            form_step.form.formvariable_set.filter(
+                key__in=component_keys,
+                form_definition=form_step.form_definition,
+            ).values_list("key", flat=True)
+        )
+        # components inside a repeating group are part of the editgrid variable
+        editgrid_component_keys = {
+            nested_component["key"]
+            for component in components
+            if component["type"] == "editgrid"
+            for nested_component in iter_components(configuration=component)
+        }
 
         form_variables = []
-        for component in iter_components(
-            configuration=form_definition_configuration, recursive=True
-        ):
+        for component in components:
             if (
                 (is_layout_component(component) and not component["type"] == "editgrid")
                 or component["type"] == "content"
                 or component["key"] in existing_form_variables_keys
-                or component_in_editgrid(form_definition_configuration, component)
+                or component["key"] in editgrid_component_keys
             ):
                 continue
 
@@ -142,17 +142,9 @@ class FormStepFactory(factory.django.DjangoModelFactory):
         model = "forms.FormStep"
 
     @classmethod
-    def create(
-        cls,
-        **kwargs,
-    ) -> FormStep:
-        form_step = super().create(**kwargs)
-        FormVariable.objects.create_for_formstep(form_step)
-        return form_step
-
-    @classmethod
-    def _create(cls, *args, **kwargs):
-        # This method is called instead of create() from the FormFactory with `generte_minimal_setup`
+    def _create(cls, *args, **kwargs) -> FormStep:
+        # Both FormStepFactory.create() and the FormFactory with `generate_minimal_setup`
+        # end up here, so the variables are only created once.
         form_step = super()._create(*args, **kwargs)
         FormVariable.objects.create_for_formstep(form_step)
         return form_step
@@ -160,17 +152,13 @@ class FormStepFactory(factory.django.DjangoModelFactory):
 
 class FormVersionFactory(factory.django.DjangoModelFactory):
     form = factory.SubFactory(FormFactory)
-    export_blob = {}
+    # the form sub factory is resolved (and saved) first, so the export can be
+    # included in the initial INSERT
+    export_blob = factory.LazyAttribute(lambda obj: form_to_json(obj.form.id))
 
     class Meta:
         model = "forms.FormVersion"
 
-    @factory.post_generation
-    def post(obj, create, extracted, **kwargs):
-        json_form = form_to_json(obj.form.id)
-        obj.export_blob = json_form
-        obj.save()
-
 
 class FormLogicFactory(factory.django.DjangoModelFactory):
     json_logic_trigger = {"==": [{"var": "test-key"}, 1]}
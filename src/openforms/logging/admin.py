@@ -20,6 +20,11 @@ class TimelineLogProxyAdmin(admin.ModelAdmin):
         "object_id",
     )
     date_hierarchy = "timestamp"
+    list_select_related = ("content_type", "user")
+
+    def get_queryset(self, request):
+        # the log messages are rendered from the content objects
+        return super().get_queryset(request).prefetch_related("content_object")
 
     def has_add_permission(self, request):
         return False
@@ -1,7 +1,9 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.template.defaultfilters import capfirst
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import format_html
 from django.utils.translation import gettext, gettext_lazy as _
 
@@ -36,14 +38,20 @@ class TimelineLogProxy(TimelineLog):
         if self.is_submission:
             return f"[{self.fmt_time}] ({self.fmt_sub})"
         elif self.content_type_id and self.object_id:
-            return f"[{self.fmt_time}] ({self.content_type.name} {self.object_id})"
+            # use the (process-wide) content types cache instead of the relation
+            content_type = ContentType.objects.get_for_id(self.content_type_id)
+            return f"[{self.fmt_time}] ({content_type.name} {self.object_id})"
         else:
             return f"[{self.fmt_time}]"
 
     @property
     def fmt_time(self) -> str:
         local_timestamp = timezone.localtime(self.timestamp)
-        return local_timestamp.strftime("%Y-%m-%d %H:%M:%S %Z")
+        # equivalent to strftime("%Y-%m-%d %H:%M:%S %Z"), but cheaper
+        date_time = local_timestamp.replace(tzinfo=None).isoformat(
+            sep=" ", timespec="seconds"
+        )
+        return f"{date_time} {local_timestamp.tzname()}"
 
     @property
     def fmt_sub(self) -> str:
@@ -56,11 +64,11 @@ class TimelineLogProxy(TimelineLog):
     def fmt_user(self) -> str:
         # if there is a .user they own the log line (usually AVG type logs)
         if self.user_id:
-            return _("Staff user {user}").format(user=str(self.user))
+            return gettext("Staff user {user}").format(user=str(self.user))
         if self.is_submission:
             auth = self.content_object.get_auth_mode_display()
             if auth:
-                return _("Authenticated via plugin {auth}").format(auth=auth)
+                return gettext("Authenticated via plugin {auth}").format(auth=auth)
         return gettext("Anonymous user")
 
     @property
@@ -71,13 +79,23 @@ class TimelineLogProxy(TimelineLog):
             return f'"{self.content_object}" (ID: {self.object_id})'
         return ""
 
-    @property
+    def _has_content_object_of_type(self, model: type[models.Model]) -> bool:
+        # compare the content type first - this avoids fetching the (unrelated) content
+        # object from the database
+        if self.content_type_id is None:
+            return False
+        content_type = ContentType.objects.get_for_model(model)
+        if self.content_type_id != content_type.pk:
+            return False
+        return isinstance(self.content_object, model)
+
+    @cached_property
     def is_submission(self) -> bool:
-        return isinstance(self.content_object, Submission)
+        return self._has_content_object_of_type(Submission)
 
-    @property
+    @cached_property
     def is_form(self) -> bool:
-        return isinstance(self.content_object, Form)
+        return self._has_content_object_of_type(Form)
 
     @property
     def fmt_plugin(self) -> str:
@@ -127,7 +145,7 @@ class TimelineLogProxy(TimelineLog):
         if not (self.object_id and self.content_type_id):
             return ""
 
-        ct = self.content_type
+        ct = ContentType.objects.get_for_id(self.content_type_id)
         return reverse(
             f"admin:{ct.app_label}_{ct.model}_change", args=(self.object_id,)
         )
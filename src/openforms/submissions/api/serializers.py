@@ -18,7 +18,7 @@ from csp_post_processor.drf.fields import CSPPostProcessedHTMLField
 from openforms.api.utils import mark_experimental
 from openforms.config.models import GlobalConfiguration
 from openforms.emails.utils import render_email_template, send_mail_html
-from openforms.forms.api.serializers import FormDefinitionSerializer
+from openforms.formio.service import rewrite_formio_components_for_request
 from openforms.forms.constants import SubmissionAllowedChoices
 from openforms.forms.models import FormStep
 from openforms.forms.validators import validate_not_deleted
@@ -199,12 +199,14 @@ class ContextAwareFormStepSerializer(serializers.ModelSerializer):
 
     @elasticapm.capture_span(span_type="app.api.serialization")
     def get_configuration(self, instance) -> dict:
-        submission = self.root.instance.submission
-        serializer = FormDefinitionSerializer(
-            instance=instance.form_definition,
-            context={**self.context, "submission": submission},
+        # Only the configuration is used, so apply the request-specific rewrites that
+        # FormDefinitionSerializer.to_representation would do instead of serializing
+        # (and discarding) the URL, translations... of the whole form definition.
+        configuration_wrapper = instance.form_definition.configuration_wrapper
+        rewrite_formio_components_for_request(
+            configuration_wrapper, request=self.context["request"]
         )
-        return serializer.data["configuration"]
+        return configuration_wrapper.configuration
 
 
 class SubmissionStepSerializer(NestedHyperlinkedModelSerializer):
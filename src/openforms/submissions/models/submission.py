@@ -706,14 +706,16 @@ class Submission(models.Model):
         Calculate and save the price of this particular submission.
         """
         logger.debug("Calculating submission %s price", self.uuid)
-        if not self.payment_required:
+        # inlined :attr:`payment_required` to avoid evaluating the price (rules) twice
+        price = get_submission_price(self) if self.form.payment_required else None
+        if not price:
             logger.debug(
                 "Submission %s does not require payment, skipping price calculation",
                 self.uuid,
             )
             return None
 
-        self.price = get_submission_price(self)
+        self.price = price
         if save:
             self.save(update_fields=["price"])
 
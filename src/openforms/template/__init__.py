@@ -6,13 +6,11 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
-
-Possible future features:
-
-* Caching for string-based templates
-* ...
+* Caching of the compiled string-based templates.
 """
 
+from functools import lru_cache
+
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
 
 __all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
@@ -29,6 +27,13 @@ def parse(source: str, backend=sandbox_backend):
     return backend.from_string(source)
 
 
+@lru_cache(maxsize=512)
+def _parse_cached(source: str, backend):
+    # compiled templates are immutable and safe to render with different contexts, and
+    # the sources are (user-contributed) configuration - a small set rendered often
+    return parse(source, backend=backend)
+
+
 def render_from_string(
     source: str,
     context: dict,
@@ -48,6 +53,6 @@ def render_from_string(
     """
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
-    template = parse(source, backend=backend)
+    template = _parse_cached(source, backend=backend)
     res = template.render(context)
     return res
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.template import TemplateSyntaxError
 from django.test import SimpleTestCase
 
@@ -21,3 +23,16 @@ class SandboxBackendTests(SimpleTestCase):
         result = sandbox_render(template, {"foo": "baz"})
 
         self.assertEqual(result, "baz bar")
+
+    def test_compiled_template_is_reused(self):
+        template = "{{ foo }} cached"
+
+        with patch.object(
+            sandbox_backend, "from_string", wraps=sandbox_backend.from_string
+        ) as mock_from_string:
+            result1 = sandbox_render(template, {"foo": "first"})
+            result2 = sandbox_render(template, {"foo": "second"})
+
+        self.assertEqual(result1, "first cached")
+        self.assertEqual(result2, "second cached")
+        mock_from_string.assert_called_once_with(template)
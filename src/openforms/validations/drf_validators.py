@@ -4,6 +4,8 @@ Utilities to work with a DRF validator (field-level) for a given validation plug
 .. todo:: use type hints from drf-stubs when we add those to base dependencies.
 """
 
+from functools import lru_cache
+
 from rest_framework import serializers
 
 from openforms.submissions.models import Submission
@@ -37,3 +39,14 @@ class PluginValidator:
         if result.is_valid:
             return
         raise serializers.ValidationError(result.messages, code="invalid")
+
+
+@lru_cache(maxsize=512)
+def get_plugin_validator(plugin: str) -> PluginValidator:
+    """
+    Get the (shared) :class:`PluginValidator` instance for the given plugin.
+
+    The validator does not hold any state specific to a serializer field, so a single
+    instance per plugin can be re-used by all fields.
+    """
+    return PluginValidator(plugin)
@@ -1,3 +1,3 @@
-from .drf_validators import PluginValidator
+from .drf_validators import PluginValidator, get_plugin_validator
 
-__all__ = ["PluginValidator"]
+__all__ = ["PluginValidator", "get_plugin_validator"]
@@ -1,7 +1,6 @@
 import base64
 import logging
 import uuid
-from collections import OrderedDict
 from datetime import datetime
 from functools import partial
 from typing import Callable, Literal, TypedDict
@@ -29,17 +28,15 @@ from .models import StufZDSConfig
 
 logger = logging.getLogger(__name__)
 
-nsmap = OrderedDict(
-    (
-        ("zkn", "http://www.egem.nl/StUF/sector/zkn/0310"),
-        ("bg", "http://www.egem.nl/StUF/sector/bg/0310"),
-        ("stuf", "http://www.egem.nl/StUF/StUF0301"),
-        ("zds", "http://www.stufstandaarden.nl/koppelvlak/zds0120"),
-        ("gml", "http://www.opengis.net/gml"),
-        ("xsi", "http://www.w3.org/2001/XMLSchema-instance"),
-        ("xmime", "http://www.w3.org/2005/05/xmlmime"),
-    )
-)
+nsmap = {
+    "zkn": "http://www.egem.nl/StUF/sector/zkn/0310",
+    "bg": "http://www.egem.nl/StUF/sector/bg/0310",
+    "stuf": "http://www.egem.nl/StUF/StUF0301",
+    "zds": "http://www.stufstandaarden.nl/koppelvlak/zds0120",
+    "gml": "http://www.opengis.net/gml",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+    "xmime": "http://www.w3.org/2005/05/xmlmime",
+}
 
 
 class PaymentStatus:
@@ -66,12 +63,34 @@ def fmt_soap_date(value: datetime):
     return value.strftime("%Y%m%d")
 
 
-def xml_value(xml, xpath, namespaces=nsmap):
-    elements = xml.xpath(xpath, namespaces=namespaces)
+def b64encode_file(fileobj, chunk_size: int = 57 * 1024) -> str:
+    """
+    Base64-encode the content of a file, reading it in chunks.
+
+    The encoded chunks are collected in a single buffer, so apart from the returned
+    string only one encoded copy is held - the full raw content never is. The chunk
+    size must be a multiple of 3 so that no padding is emitted halfway.
+    """
+    fileobj.seek(0)
+    buffer = bytearray()
+    while chunk := fileobj.read(chunk_size):
+        buffer += base64.b64encode(chunk)
+    return buffer.decode("ascii")
+
+
+ZAAK_IDENTIFICATIE_XPATH = etree.XPath("//zkn:zaak/zkn:identificatie", namespaces=nsmap)
+DOCUMENT_IDENTIFICATIE_XPATH = etree.XPath(
+    "//zkn:document/zkn:identificatie", namespaces=nsmap
+)
+SOAP_FAULT_XPATH = etree.XPath("//*[local-name()='Fault']")
+
+
+def xml_value(xml, xpath: etree.XPath):
+    elements = xpath(xml)
     if len(elements) == 1:
         return elements[0].text
     else:
-        raise ValueError(f"xpath not found {xpath}")
+        raise ValueError(f"xpath not found {xpath.path}")
 
 
 class ZaakOptions(TypedDict):
@@ -208,9 +227,7 @@ class Client(BaseClient):
         )
 
         try:
-            zaak_identificatie = xml_value(
-                xml, "//zkn:zaak/zkn:identificatie", namespaces=nsmap
-            )
+            zaak_identificatie = xml_value(xml, ZAAK_IDENTIFICATIE_XPATH)
         except ValueError as e:
             raise RegistrationFailed(
                 "cannot find '/zaak/identificatie' in backend response"
@@ -284,9 +301,7 @@ class Client(BaseClient):
         )
 
         try:
-            document_identificatie = xml_value(
-                xml, "//zkn:document/zkn:identificatie", namespaces=nsmap
-            )
+            document_identificatie = xml_value(xml, DOCUMENT_IDENTIFICATIE_XPATH)
         except ValueError as e:
             raise RegistrationFailed(
                 "cannot find '/document/identificatie' in backend response"
@@ -301,8 +316,7 @@ class Client(BaseClient):
         document: SubmissionReport | SubmissionFileAttachment,
         doc_data: dict,
     ) -> None:
-        document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
+        base64_body = b64encode_file(document.content)
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -418,21 +432,17 @@ def parse_soap_error_text(response):
     </soap11env:Envelope>
     """
 
-    message = response.text
     if response.headers.get("content-type", "").startswith("text/html"):
-        message = response.status_code
-    else:
-        try:
-            xml = fromstring(response.text.encode("utf8"))
-            faults = xml.xpath("//*[local-name()='Fault']", namespaces=nsmap)
-            if faults:
-                messages = []
-                for fault in faults:
-                    messages.append(
-                        etree.tostring(fault, pretty_print=True, encoding="unicode")
-                    )
-                message = "\n".join(messages)
-        except etree.XMLSyntaxError:
-            pass
-
-    return message
+        return response.status_code
+
+    try:
+        xml = fromstring(response.content)
+    except etree.XMLSyntaxError:
+        return response.text
+
+    if not (faults := SOAP_FAULT_XPATH(xml)):
+        return response.text
+
+    return "\n".join(
+        etree.tostring(fault, pretty_print=True, encoding="unicode") for fault in faults
+    )
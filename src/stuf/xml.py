@@ -5,8 +5,20 @@ Inspired by https://github.com/mvantellingen/python-zeep/pull/1179/ as their sol
 for the deprecated defusedxml.lxml module and the defaults applied in defusedxml.lxml.
 """
 
+import threading
+
 from lxml.etree import XMLParser, fromstring as _fromstring
 
+_local = threading.local()
+
+
+def _get_parser() -> XMLParser:
+    # lxml parsers may be reused, but not shared between threads
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = XMLParser(resolve_entities=False)
+    return parser
+
 
 def fromstring(content: str | bytes):
     """
@@ -14,5 +26,4 @@ def fromstring(content: str | bytes):
 
     Resolving entities is a security risk, which is why we disable it.
     """
-    parser = XMLParser(resolve_entities=False)
-    return _fromstring(content, parser=parser)
+    return _fromstring(content, parser=_get_parser())